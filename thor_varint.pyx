@@ -0,0 +1,49 @@
+# cython: language_level=3
+"""
+THORChain Varint Encoder (Cython)
+=================================
+
+Compiled drop-in for encode_varint() in Working_Implementation.py.
+
+Build in place next to Working_Implementation.py with:
+    cythonize -i thor_varint.pyx
+
+Working_Implementation.py picks this module up automatically when it is
+importable and otherwise uses its pure-Python encoder.
+"""
+
+
+cpdef bytes encode_varint(value):
+    """
+    Encode a varint (variable-length integer).
+
+    The value is converted to a C unsigned long long once and encoded into
+    a 10-byte stack buffer, so the loop runs without any Python objects.
+
+    Args:
+        value: Non-negative integer below 2**64 to encode as varint
+
+    Returns:
+        Varint-encoded bytes
+
+    Raises:
+        TypeError: If value is not an int
+        ValueError: If value is negative
+        OverflowError: If value does not fit in 64 bits
+    """
+    cdef unsigned char buf[10]
+    cdef int i = 0
+    cdef unsigned long long v
+
+    if not isinstance(value, int):
+        raise TypeError(f"Cannot varint-encode non-integer value: {value!r}")
+    if value < 0:
+        raise ValueError(f"Cannot varint-encode negative value: {value}")
+    v = value
+
+    while v >= 0x80:
+        buf[i] = <unsigned char>((v & 0x7F) | 0x80)
+        v >>= 7
+        i += 1
+    buf[i] = <unsigned char>v
+    return buf[:i + 1]